@@ -1,8 +1,9 @@
 import itertools
-from typing import Generator, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Generator, Iterator, Optional, Tuple
 from pathlib import Path
 
-from io_utils import write_batches
+from io_utils import append_file, ensure_dir, print_progress
 
 
 class BruteForceGenerator:
@@ -17,6 +18,9 @@ class BruteForceGenerator:
         'alphanumeric': 'abcdefghijklmnopqrstuvwxyz0123456789',
     }
 
+    # Max number of pre-joined tail strings kept per hyphen layout
+    TAIL_POOL_LIMIT = 4096
+
     def __init__(self, char_type: str = 'alphanumeric', min_len: int = 2,
                  max_len: int = 4, hyphen_mode: str = 'with', tld: str = 'lt'):
         """
@@ -135,6 +139,59 @@ class BruteForceGenerator:
 
         return total
 
+    def _hyphen_layouts(self, length: int) -> Generator[Tuple[int, ...], None, None]:
+        """
+        Yield every allowed set of hyphen positions for a label of given length.
+
+        Hyphens may only sit strictly inside the label and never next to each
+        other, so each layout produces valid domains only.
+
+        Args:
+            length: Label length
+
+        Yields:
+            Sorted tuples of hyphen positions (empty tuple for no hyphens)
+        """
+        if self.hyphen_mode != 'only':
+            yield ()
+        if self.hyphen_mode == 'without':
+            return
+
+        for count in range(1, (length - 1) // 2 + 1):
+            # Non-adjacent picks from 1..length-2 map one-to-one onto plain
+            # combinations of a range shrunk by `count`, shifted by their index.
+            for combo in itertools.combinations(range(1, length - count), count):
+                yield tuple(pos + i for i, pos in enumerate(combo))
+
+    def _iter_rows(self, suffix: str) -> Iterator[str]:
+        """
+        Yield every valid label with `suffix` appended.
+
+        Domains are built valid by construction: hyphens are only placed where
+        DNS rules allow them, so no candidate has to be filtered afterwards.
+        """
+        for head, tail in self._iter_layout_pools(suffix):
+            yield from map(''.join, itertools.product(*head, tail))
+
+    def _iter_layout_pools(self, suffix: str) -> Iterator[Tuple[list, list]]:
+        """
+        Yield (head pools, tail strings) for every length and hyphen layout.
+
+        The last position is never a hyphen, so the suffix is baked into its
+        pool. Trailing positions are then pre-joined into a single pool of
+        tail strings (up to TAIL_POOL_LIMIT entries), specializing each layout
+        so every row needs fewer pieces joined.
+        """
+        base_chars = self.CHARACTER_SETS[self.char_type]
+        last_pool = [char + suffix for char in base_chars]
+        for length in range(self.min_len, self.max_len + 1):
+            for hyphens in self._hyphen_layouts(length):
+                head = [('-',) if i in hyphens else base_chars for i in range(length - 1)]
+                tail = last_pool
+                while head and len(head[-1]) * len(tail) <= self.TAIL_POOL_LIMIT:
+                    tail = [char + rest for char in head.pop() for rest in tail]
+                yield head, tail
+
     def generate(self) -> Generator[str, None, None]:
         """
         Generate all valid domain combinations.
@@ -142,27 +199,105 @@ class BruteForceGenerator:
         Yields:
             Domain names with TLD (e.g., 'abc.lt')
         """
-        for length in range(self.min_len, self.max_len + 1):
-            for combo in itertools.product(self.charset, repeat=length):
-                domain = ''.join(combo)
-                if self.validate_domain(domain):
-                    yield f"{domain}.{self.tld}"
+        yield from self._iter_rows(f".{self.tld}")
 
-    def generate_to_file(self, filepath: str, batch_size: int = 10000) -> int:
+    def generate_to_file(self, filepath: str, batch_size: int = 10000,
+                         progress_every: int = 100000, workers: int = 1) -> int:
         """
         Generate domains and write to file in batches.
 
+        Rows are produced with the ".tld\n" terminator already attached. Each
+        prefix of a hyphen layout expands into a whole block of rows with one
+        C-level join, and blocks are encoded and written in batches.
+
         Args:
             filepath: Output file path
-            batch_size: Number of domains to write per batch
+            batch_size: Approximate number of domains to write per batch
+            progress_every: Print progress every N domains (0 disables it)
+            workers: Worker processes; above 1, each length is written in parallel
 
         Returns:
             Total number of domains written
         """
-        estimated = self.estimate_count()
-        return write_batches(
-            self.generate(),
-            filepath,
-            batch_size=batch_size,
-            progress_total=estimated if estimated > 0 else None,
-        )
\ No newline at end of file
+        if workers > 1 and self.max_len > self.min_len:
+            return self._generate_to_file_parallel(filepath, batch_size, progress_every, workers)
+
+        estimated = self.estimate_count() if progress_every else 0
+        output_path = Path(filepath)
+        ensure_dir(str(output_path.parent))
+
+        count = 0
+        reported = 0
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            for head, tail in self._iter_layout_pools(f".{self.tld}\n"):
+                # prefix + prefix.join(tail) == ''.join(prefix + t for t in tail)
+                blocks = (prefix + prefix.join(tail) for prefix in map(''.join, itertools.product(*head)))
+                blocks_per_batch = max(1, batch_size // len(tail))
+                while True:
+                    batch = list(itertools.islice(blocks, blocks_per_batch))
+                    if not batch:
+                        break
+                    f.write(''.join(batch).encode('utf-8'))
+                    count += len(batch) * len(tail)
+                    if estimated and count - reported >= progress_every:
+                        print_progress(count, estimated)
+                        reported = count
+
+        if estimated and count != reported:
+            print_progress(count, estimated)
+        return count
+
+    def _generate_to_file_parallel(self, filepath: str, batch_size: int,
+                                   progress_every: int, workers: int) -> int:
+        """
+        Write each length to its own part file in a worker process, then
+        concatenate the parts in length order (same output as sequential).
+
+        Args:
+            filepath: Output file path
+            batch_size: Approximate number of domains to write per batch
+            progress_every: Print progress every N domains (0 disables it);
+                checked as each length's part is appended
+            workers: Maximum number of worker processes
+
+        Returns:
+            Total number of domains written
+        """
+        estimated = self.estimate_count() if progress_every else 0
+        output_path = Path(filepath)
+        ensure_dir(str(output_path.parent))
+
+        lengths = range(self.min_len, self.max_len + 1)
+        parts = [output_path.with_name(f"{output_path.name}.part{length}") for length in lengths]
+        count = 0
+        reported = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_write_length, self.char_type, length, self.hyphen_mode,
+                                self.tld, str(part), batch_size)
+                    for length, part in zip(lengths, parts)
+                ]
+                counts = [future.result() for future in futures]
+
+            with open(output_path, 'wb') as f:
+                for part, part_count in zip(parts, counts):
+                    append_file(str(part), f)
+                    count += part_count
+                    if estimated and count - reported >= progress_every:
+                        print_progress(count, estimated)
+                        reported = count
+        finally:
+            for part in parts:
+                part.unlink(missing_ok=True)
+
+        if estimated and count != reported:
+            print_progress(count, estimated)
+        return count
+
+
+def _write_length(char_type: str, length: int, hyphen_mode: str, tld: str,
+                  filepath: str, batch_size: int) -> int:
+    """Worker entry point: write every domain of one length to `filepath`."""
+    generator = BruteForceGenerator(char_type, length, length, hyphen_mode, tld)
+    return generator.generate_to_file(filepath, batch_size=batch_size, progress_every=0)
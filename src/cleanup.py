@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Optional, Set, Tuple
-from urllib.parse import urlparse
+from typing import BinaryIO, FrozenSet, Iterable, Iterator, Optional, Set, Tuple
 
 import tldextract
 
-GOV_DOMAINS: Set[str] = {"lrv", "edu", "mil"}
-GOV_SUFFIXES: Set[str] = {"lrv.lt", "edu.lt", "mil.lt", "gov.lt"}
+GOV_DOMAINS: FrozenSet[str] = frozenset({"lrv", "edu", "mil"})
+GOV_SUFFIXES: FrozenSet[str] = frozenset({"lrv.lt", "edu.lt", "mil.lt", "gov.lt"})
+
+_SCHEME_RE = re.compile(r"^[a-zA-Z]+://")
+# urlparse drops these anywhere in a URL before splitting it (bpo-43882).
+_URL_UNSAFE_CHARS = str.maketrans("", "", "\t\r\n")
+_IPV4_RE = re.compile(r"^\d+(\.\d+){3}$")
+_ALLOWED_RE = re.compile(r"^[\w\-.]+$", re.UNICODE)
+
+# Hyphen rules for one label: no leading/trailing hyphen and no "--" unless the
+# label carries the punycode "xn--" prefix.
+_HYPHEN_RULES = r"(?!-)(?!(?!xn--)[^.]*--)"
+_LABEL_PATTERN = rf"{_HYPHEN_RULES}[^.]{{3,63}}(?<!-)"
+# Both validators in one pass: every label but the TLD is 3-63 chars, all obey the hyphen rules.
+_DOMAIN_RE = re.compile(rf"(?:{_LABEL_PATTERN}\.)+{_HYPHEN_RULES}[^.]+(?<!-)")
+# Already-normalized label that process_domain passes through untouched as "<label>.lt"
+# ("www" would be stripped as a prefix, so it always takes the full path).
+_PLAIN_LABEL_RE = re.compile(rf"(?!www$){_HYPHEN_RULES}[a-z0-9-]{{3,63}}(?<!-)")
+
+# ASCII bytes that str.strip() treats as whitespace (bytes.strip() misses \x1c-\x1f).
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# Offline extractor built once: bundled suffix list snapshot, no disk cache probe.
+_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), fallback_to_snapshot=True, cache_dir=None)
 
 
 @dataclass
@@ -53,6 +78,35 @@ def is_valid_hyphen_rules(domain: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+def _split_domain(cleaned: str) -> Tuple[str, str, str]:
+    """
+    Split a lowercased host into (subdomain, domain, suffix).
+
+    Plain ".lt" hosts are split by hand; anything ending in one of the
+    multi-label government suffixes (and every other TLD) goes through the
+    public suffix list.
+    """
+    if cleaned.endswith(".lt"):
+        labels = cleaned.split(".")
+        if f"{labels[-2]}.lt" not in GOV_SUFFIXES:
+            return ".".join(labels[:-2]), labels[-2], "lt"
+
+    ext = _EXTRACT(cleaned)
+    return ext.subdomain, ext.domain, ext.suffix
+
+
+def plain_lt_domain(label: str) -> Optional[str]:
+    """
+    Return "<label>.lt" when process_domain would accept it unchanged.
+
+    Cheap pre-check for labels that are already lowercase ASCII; returns None
+    when the full pipeline has to decide.
+    """
+    if _PLAIN_LABEL_RE.fullmatch(label) and f"{label}.lt" not in GOV_SUFFIXES:
+        return f"{label}.lt"
+    return None
+
+
 def process_domain(
     raw: str,
     *,
@@ -66,7 +120,42 @@ def process_domain(
     Normalize and validate a domain string.
 
     Returns (domain, None) when accepted, or (None, reason) when skipped.
+    Results are memoized, so repeated lines cost a single cache lookup.
     """
+    return _process_domain_cached(
+        raw,
+        target_tld,
+        allow_other_tlds,
+        allow_subdomains,
+        frozenset(gov_domains) if gov_domains else GOV_DOMAINS,
+        frozenset(gov_suffixes) if gov_suffixes else GOV_SUFFIXES,
+    )
+
+
+def process_domain_fast(
+    raw: str,
+    target_tld: Optional[str] = "lt",
+    allow_other_tlds: bool = False,
+    allow_subdomains: bool = False,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Same as process_domain with the default government sets.
+
+    Hot-loop variant: positional arguments and no fallback or frozenset
+    conversion for the government sets on each call.
+    """
+    return _process_domain_cached(raw, target_tld, allow_other_tlds, allow_subdomains, GOV_DOMAINS, GOV_SUFFIXES)
+
+
+@lru_cache(maxsize=200_000)
+def _process_domain_cached(
+    raw: str,
+    target_tld: Optional[str],
+    allow_other_tlds: bool,
+    allow_subdomains: bool,
+    gov_domains: FrozenSet[str],
+    gov_suffixes: FrozenSet[str],
+) -> Tuple[Optional[str], Optional[str]]:
     if raw is None:
         return None, "empty"
 
@@ -76,45 +165,47 @@ def process_domain(
 
     cleaned = cleaned.rstrip(".")
 
-    if re.match(r"^[a-zA-Z]+://", cleaned):
-        parsed = urlparse(cleaned)
-        cleaned = parsed.netloc or cleaned
+    if _SCHEME_RE.match(cleaned):
+        # Host part only: cut the scheme, then path, query and fragment.
+        rest = cleaned.split("://", 1)[1].translate(_URL_UNSAFE_CHARS)
+        netloc = rest.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+        cleaned = netloc or cleaned
 
     if cleaned.lower().startswith("www."):
         cleaned = cleaned[4:]
 
-    if re.match(r"^\d+(\.\d+){3}$", cleaned):
+    if _IPV4_RE.match(cleaned):
         return None, "ip address"
 
-    if not re.match(r"^[\w\-.]+$", cleaned, re.UNICODE):
+    if not _ALLOWED_RE.match(cleaned):
         return None, "invalid characters"
 
     cleaned = cleaned.lower()
 
-    ext = tldextract.extract(cleaned)
-    if not ext.domain or not ext.suffix:
+    subdomain, registered, suffix = _split_domain(cleaned)
+    if not registered or not suffix:
         return None, "invalid domain/suffix"
 
-    suffix = ext.suffix
-    domain = f"{ext.domain}.{suffix}"
-
-    use_gov_domains = gov_domains or GOV_DOMAINS
-    use_gov_suffixes = gov_suffixes or GOV_SUFFIXES
+    domain = f"{registered}.{suffix}"
 
     if target_tld:
-        if suffix != target_tld and suffix not in use_gov_suffixes:
+        if suffix != target_tld and suffix not in gov_suffixes:
             if not allow_other_tlds:
                 return None, "disallowed tld"
     if suffix == "lt":
-        if suffix in use_gov_suffixes or ext.domain in use_gov_domains:
-            if ext.subdomain:
-                domain = f"{ext.subdomain}.{domain}"
-        elif ext.subdomain and not allow_subdomains:
+        if suffix in gov_suffixes or registered in gov_domains:
+            if subdomain:
+                domain = f"{subdomain}.{domain}"
+        elif subdomain and not allow_subdomains:
             return None, "non-govt subdomain"
     else:
-        if ext.subdomain and not allow_subdomains:
+        if subdomain and not allow_subdomains:
             return None, "subdomain not allowed"
 
+    if _DOMAIN_RE.fullmatch(domain):
+        return domain, None
+
+    # Slow path: re-run the individual rules to report which one was broken.
     is_valid, reason = is_valid_domain_length(domain)
     if not is_valid:
         return None, reason
@@ -126,6 +217,32 @@ def process_domain(
     return domain, None
 
 
+def _process_chunk(
+    entries: Iterable[Tuple[str, int, int]],
+    *,
+    target_tld: Optional[str],
+    allow_other_tlds: bool,
+    allow_subdomains: bool,
+) -> Tuple[Set[str], list[tuple[int, str, str]], int]:
+    """
+    Validate (line, first line number, occurrences) entries.
+
+    Returns (cleaned domains, errors, skipped line count). Runs in pool
+    workers too, each of which has its own module-level extractor.
+    """
+    cleaned: Set[str] = set()
+    errors: list[tuple[int, str, str]] = []
+    skipped_count = 0
+    for stripped, line_num, occurrences in entries:
+        domain, reason = process_domain_fast(stripped, target_tld, allow_other_tlds, allow_subdomains)
+        if domain:
+            cleaned.add(domain)
+        else:
+            skipped_count += occurrences
+            errors.append((line_num, stripped, reason or "unknown"))
+    return cleaned, errors, skipped_count
+
+
 def clean_file(
     input_path: Path | str,
     output_path: Optional[Path | str] = None,
@@ -135,6 +252,8 @@ def clean_file(
     allow_other_tlds: bool = False,
     allow_subdomains: bool = False,
     progress_every: int = 1000,
+    workers: int = 1,
+    chunk_size: int = 50_000,
 ) -> CleanupResult:
     input_file = Path(input_path)
     if not input_file.exists():
@@ -148,27 +267,44 @@ def clean_file(
     processed_count = 0
     skipped_count = 0
 
+    # Collapse duplicate lines first, keeping the first line number and the
+    # number of occurrences, so each distinct value is validated only once.
+    unique: dict[str, list[int]] = {}
     with open(input_file, "r", encoding="utf-8") as f:
         for line_num, raw_line in enumerate(f, start=1):
             if progress_every and line_num % progress_every == 0:
                 print(f"...processed {line_num} lines...")
 
-            stripped = raw_line.rstrip("\n")
-            if not stripped.strip():
+            stripped = raw_line.strip()
+            if not stripped:
                 continue
 
             processed_count += 1
-            domain, reason = process_domain(
-                stripped,
-                target_tld=target_tld,
-                allow_other_tlds=allow_other_tlds,
-                allow_subdomains=allow_subdomains,
-            )
-            if domain:
-                cleaned.add(domain)
+            seen = unique.get(stripped)
+            if seen is None:
+                unique[stripped] = [line_num, 1]
             else:
-                skipped_count += 1
-                errors.append((line_num, stripped, reason or "unknown"))
+                seen[1] += 1
+
+    process_chunk = partial(
+        _process_chunk,
+        target_tld=target_tld,
+        allow_other_tlds=allow_other_tlds,
+        allow_subdomains=allow_subdomains,
+    )
+    entries = ((stripped, line_num, occurrences) for stripped, (line_num, occurrences) in unique.items())
+    if workers > 1 and len(unique) > chunk_size:
+        chunks = iter(lambda: list(islice(entries, chunk_size)), [])
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.imap_unordered(process_chunk, chunks)
+            for chunk_cleaned, chunk_errors, chunk_skipped in results:
+                cleaned |= chunk_cleaned
+                errors.extend(chunk_errors)
+                skipped_count += chunk_skipped
+        # Chunks finish in any order; keep the error log in line order.
+        errors.sort()
+    else:
+        cleaned, errors, skipped_count = process_chunk(entries)
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, "w", encoding="utf-8") as f:
@@ -190,6 +326,27 @@ def clean_file(
     )
 
 
+def _read_line_chunks(f: BinaryIO, block_size: int = 1 << 20) -> Iterator[bytes]:
+    """
+    Yield ~block_size pieces of a binary file, each cut at a line break.
+
+    A line is never split across pieces, so each one can be split with
+    bytes.splitlines() (the same line breaks as text mode) and decoded alone.
+    """
+    pending = b""
+    while True:
+        block = f.read(block_size)
+        if not block:
+            if pending:
+                yield pending
+            return
+        data = pending + block
+        cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+        if cut:
+            yield data[:cut]
+        pending = data[cut:]
+
+
 def remove_domains(
     parent_path: Path | str,
     removees_path: Path | str,
@@ -212,29 +369,53 @@ def remove_domains(
         f"{parent_file.stem}_minus_{removees_file.stem}{parent_file.suffix or '.txt'}"
     )
 
+    # Matching runs on UTF-8 bytes so ASCII lines (nearly all of them) are never
+    # decoded; bytes.lower()/strip() agree with str on pure ASCII, and chunks
+    # holding any other byte go through str for the exact Unicode semantics.
     with open(removees_file, "r", encoding="utf-8") as f:
-        removees = {line.strip().lower() for line in f if line.strip()}
+        removees = {line.strip().lower().encode("utf-8") for line in f if line.strip()}
 
-    kept: list[str] = []
+    kept_count = 0
     removed_count = 0
 
-    with open(parent_file, "r", encoding="utf-8") as f:
-        for line in f:
-            domain = line.strip()
-            if not domain:
-                continue
-            if domain.lower() in removees:
-                removed_count += 1
-            else:
-                kept.append(domain)
-
+    # Stream kept lines straight to a sibling temp file instead of collecting
+    # them, then move it into place (output may be the parent file itself).
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        for domain in kept:
-            f.write(domain + "\n")
+    partial_file = output_file.with_name(output_file.name + ".part")
+    try:
+        with open(parent_file, "rb") as fin, open(partial_file, "wb") as fout:
+            for chunk in _read_line_chunks(fin):
+                kept = []
+                if chunk.isascii():
+                    for line in chunk.splitlines():
+                        domain = line.strip(_ASCII_WHITESPACE)
+                        if not domain:
+                            continue
+                        if domain.lower() in removees:
+                            removed_count += 1
+                        else:
+                            kept.append(domain)
+                else:
+                    for line in chunk.splitlines():
+                        text = line.decode("utf-8").strip()
+                        if not text:
+                            continue
+                        if text.lower().encode("utf-8") in removees:
+                            removed_count += 1
+                        else:
+                            kept.append(text.encode("utf-8"))
+                if kept:
+                    kept_count += len(kept)
+                    kept.append(b"")
+                    fout.write(b"\n".join(kept))
+        os.replace(partial_file, output_file)
+    except BaseException:
+        # Don't leave a half-written temp file behind (e.g. invalid UTF-8 input)
+        partial_file.unlink(missing_ok=True)
+        raise
 
     return RemoveResult(
-        kept_count=len(kept),
+        kept_count=kept_count,
         removed_count=removed_count,
         output_path=output_file,
     )
@@ -1,5 +1,9 @@
+import codecs
+import os
+import shutil
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Iterable, Optional
 
 
 def make_output_path(prefix: str, **params) -> str:
@@ -18,6 +22,43 @@ def make_output_path(prefix: str, **params) -> str:
     return str(Path('assets') / 'output' / filename)
 
 
+def ensure_dir(dirpath: str) -> None:
+    """Create a directory (and parents) if it does not exist yet."""
+    Path(dirpath).mkdir(parents=True, exist_ok=True)
+
+
+def append_file(src_path: str, dst: BinaryIO) -> None:
+    """
+    Append the contents of `src_path` to the open binary file `dst`.
+
+    Uses os.sendfile (in-kernel copy) where the platform supports it for
+    regular files, falling back to a buffered copy.
+    """
+    dst.flush()
+    with open(src_path, 'rb') as src:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        if hasattr(os, 'sendfile'):
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                if offset:
+                    raise
+        if offset < size:
+            src.seek(offset)
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def print_progress(count: int, total: int) -> None:
+    """Print a basic progress line without external dependencies."""
+    pct = (count / total) * 100 if total else 0
+    print(f"Progress: {count:,}/{total:,} ({pct:0.2f}%)")
+
+
 def write_batches(
     iterable: Iterable[str],
     filepath: str,
@@ -25,41 +66,47 @@ def write_batches(
     *,
     progress_total: Optional[int] = None,
     progress_every: int = 100000,
+    suffix: str = '',
+    encoding: str = 'utf-8',
 ) -> int:
     """
     Write items from an iterable to a file in batches (one per line).
 
+    Batches are pulled with islice and joined once (an empty trailing item
+    supplies the final newline), so there is no per-item Python loop and no
+    extra copy for the terminator. A `suffix` is folded into the same join
+    separator, so it costs nothing per item either.
+
     Args:
         iterable: Iterable of strings to write.
         filepath: Destination file path.
         batch_size: Number of lines per batch write.
+        suffix: Text appended to every item (e.g. '.lt').
+        encoding: Output text encoding.
 
     Returns:
         Total number of items written.
     """
     count = 0
-    batch = []
+    items = iter(iterable)
+    separator = suffix + '\n'
+    # One incremental encoder per file, so codecs with a BOM (utf-16,
+    # utf-8-sig) emit it once at the start rather than once per batch
+    encode = codecs.getincrementalencoder(encoding)().encode
 
     output_path = Path(filepath)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for item in iterable:
-            batch.append(item)
-            count += 1
-            if len(batch) >= batch_size:
-                f.write('\n'.join(batch) + '\n')
-                batch = []
-                if progress_total:
-                    # Basic progress report without external dependencies
-                    if count % progress_every == 0:
-                        pct = (count / progress_total) * 100 if progress_total else 0
-                        print(f"Progress: {count:,}/{progress_total:,} ({pct:0.2f}%)")
-
-        if batch:
-            f.write('\n'.join(batch) + '\n')
-            if progress_total:
-                pct = (count / progress_total) * 100 if progress_total else 0
-                print(f"Progress: {count:,}/{progress_total:,} ({pct:0.2f}%)")
+    ensure_dir(str(output_path.parent))
+
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            count += len(batch)
+            is_last = len(batch) < batch_size
+            batch.append('')
+            f.write(encode(separator.join(batch)))
+            if progress_total and (is_last or count % progress_every == 0):
+                print_progress(count, progress_total)
 
     return count
@@ -9,12 +9,11 @@ import argparse
 import sys
 from pathlib import Path
 
-from brute_generator import BruteForceGenerator
-from word_transform_generator import WordTransformGenerator
-from markov_generator import MarkovGenerator
-from cleanup import clean_file, remove_domains
 from io_utils import make_output_path
 
+# Generator modules are imported inside their handlers so `--help` and the
+# generators that don't need it skip loading tldextract (~80 ms).
+
 
 def create_parser():
     """Create the argument parser."""
@@ -55,6 +54,12 @@ def create_parser():
         action='store_true',
         help='Accept any TLD instead of enforcing --tld only'
     )
+    cleanup_parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for validation (default: 1)'
+    )
     cleanup_parser.add_argument(
         '--removees', '-r',
         help='Optional file of domains to remove from the cleaned output'
@@ -102,6 +107,12 @@ def create_parser():
         '--output', '-o',
         help='Output file path (default: auto-generated)'
     )
+    brute_parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes, one length per process (default: 1)'
+    )
     brute_parser.add_argument(
         '--estimate-only', '-e',
         action='store_true',
@@ -176,6 +187,11 @@ def create_parser():
         default=2,
         help='Minimum n-gram frequency threshold (default: 2)'
     )
+    markov_parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed for reproducible output (default: random)'
+    )
     markov_parser.add_argument(
         '--estimate-only', '-e',
         action='store_true',
@@ -187,6 +203,8 @@ def create_parser():
 
 def generate_brute_force(args):
     """Handle brute force generation."""
+    from brute_generator import BruteForceGenerator
+
     # Handle --length parameter
     if args.length is not None:
         if args.min != 2 or args.max != 4:  # Check if min/max were also specified
@@ -220,14 +238,10 @@ def generate_brute_force(args):
     else:
         output_file = args.output
 
-    # Ensure output directory exists
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     print(f"Generating domains to: {output_file}")
 
     try:
-        count = generator.generate_to_file(str(output_path))
+        count = generator.generate_to_file(output_file, workers=args.workers)
         print(f"Successfully generated {count:,} domains")
         return 0
     except Exception as e:
@@ -237,6 +251,8 @@ def generate_brute_force(args):
 
 def generate_word_transform(args):
     """Handle word transform generation."""
+    from word_transform_generator import WordTransformGenerator
+
     try:
         generator = WordTransformGenerator(
             input_file=args.input,
@@ -263,14 +279,10 @@ def generate_word_transform(args):
     else:
         output_file = args.output
 
-    # Ensure output directory exists
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     print(f"Generating domains to: {output_file}")
 
     try:
-        count = generator.generate_to_file(str(output_path))
+        count = generator.generate_to_file(output_file)
         print(f"Successfully generated {count:,} domains")
         return 0
     except Exception as e:
@@ -280,6 +292,8 @@ def generate_word_transform(args):
 
 def run_cleanup(args):
     """Handle standalone cleanup of domain lists."""
+    from cleanup import clean_file, remove_domains
+
     input_path = Path(args.input)
     output_path = Path(args.output) if args.output else Path(f"assets/output/cleanup_{input_path.stem}.txt")
     errors_path = Path(args.errors) if args.errors else output_path.with_suffix('.errors.txt')
@@ -292,6 +306,7 @@ def run_cleanup(args):
             target_tld=args.tld,
             allow_other_tlds=args.allow_other_tlds,
             allow_subdomains=args.allow_subdomains,
+            workers=args.workers,
         )
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -318,6 +333,8 @@ def run_cleanup(args):
 
 def generate_markov(args):
     """Handle Markov chain generation."""
+    from markov_generator import MarkovGenerator
+
     try:
         generator = MarkovGenerator(
             input_file=args.input,
@@ -326,7 +343,8 @@ def generate_markov(args):
             max_len=args.max,
             count=args.count,
             tld=args.tld,
-            min_frequency=args.min_frequency
+            min_frequency=args.min_frequency,
+            seed=args.seed
         )
     except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -353,14 +371,10 @@ def generate_markov(args):
     else:
         output_file = args.output
 
-    # Ensure output directory exists
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     print(f"Generating domains to: {output_file}")
 
     try:
-        count = generator.generate_to_file(str(output_path))
+        count = generator.generate_to_file(output_file)
         print(f"Successfully generated {count:,} domains")
         return 0
     except Exception as e:
@@ -5,12 +5,40 @@ Trains on corpus of domains/words (one per line) and generates new combinations
 following learned character transition probabilities.
 """
 import random
+import re
+from array import array
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Generator, Set, Dict, List
+from typing import Generator, Set, Dict, List, Optional, Sequence, Tuple
 
 from io_utils import write_batches
 
+# Sampling table: (choices, cumulative weights, total weight)
+SamplingTable = Tuple[Sequence[str], Sequence[int], int]
+
+# Common TLD suffixes stripped from training input
+_TLD_SUFFIX_RE = re.compile(r'\.(?:lt|com|net|org|io|co)\Z')
+
+
+class _DnsCharTable(dict):
+    """
+    str.translate table keeping alphanumerics and hyphens, deleting the rest.
+
+    Code points are classified on first sight and cached, so the table covers
+    non-ASCII letters without being built up front.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == '-' else None
+        self[codepoint] = value
+        return value
+
+
+_DNS_CHARS = _DnsCharTable()
+
 
 class MarkovGenerator:
     """
@@ -18,6 +46,9 @@ class MarkovGenerator:
     and produces new domain/word candidates based on transition probabilities.
     """
 
+    # Lines per Counter pass when counting training n-grams
+    TRAIN_BATCH_LINES = 10000
+
     def __init__(
         self,
         input_file: str,
@@ -26,7 +57,8 @@ class MarkovGenerator:
         max_len: int = 8,
         count: int = 10000,
         tld: str = 'lt',
-        min_frequency: int = 2
+        min_frequency: int = 2,
+        seed: Optional[int] = None
     ):
         """
         Initialize the Markov generator and train on input corpus.
@@ -39,6 +71,7 @@ class MarkovGenerator:
             count: Number of domains to generate
             tld: Top-level domain to append
             min_frequency: Minimum n-gram frequency to include in model
+            seed: Random seed for reproducible output (default: system entropy)
         """
         if order < 1:
             raise ValueError("Order must be at least 1")
@@ -55,11 +88,20 @@ class MarkovGenerator:
         self.tld = tld
         self.min_frequency = min_frequency
 
+        # Private RNG so sampling neither touches nor depends on the global
+        # random state; its bound random() is cached for the sampling loop
+        self._rng = random.Random(seed)
+        self._random = self._rng.random
+
         # Model storage
         self.transitions: Dict[str, Counter] = defaultdict(Counter)
         self.start_states: Counter = Counter()
         self.training_set: Set[str] = set()
 
+        # Sampling tables precomputed from the model after training
+        self._start_table: SamplingTable = ((), array('Q'), 0)
+        self._transition_tables: Dict[str, SamplingTable] = {}
+
         # Train on input
         self._train()
 
@@ -76,13 +118,10 @@ class MarkovGenerator:
         text = line.strip().lower()
 
         # Remove common TLDs if present
-        for tld in ['.lt', '.com', '.net', '.org', '.io', '.co']:
-            if text.endswith(tld):
-                text = text[:-len(tld)]
-                break
+        text = _TLD_SUFFIX_RE.sub('', text)
 
         # Keep only valid DNS characters: a-z, 0-9, hyphen
-        text = ''.join(c for c in text if c.isalnum() or c == '-')
+        text = text.translate(_DNS_CHARS)
 
         # Remove leading/trailing hyphens
         text = text.strip('-')
@@ -100,36 +139,54 @@ class MarkovGenerator:
         print(f"Training Markov model (order={self.order}) on {self.input_file}...")
 
         processed = 0
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                text = self._normalize_input(line)
-
-                # Skip invalid entries
-                if len(text) < self.order or len(text) > 63:
-                    continue
-
-                # Add to training set for deduplication
-                self.training_set.add(text)
 
-                # Add boundary markers
-                text = '^' * self.order + text + '$'
-
-                # Extract start state (first n characters after boundary)
-                start_state = text[:self.order]
-                self.start_states[start_state] += 1
-
-                # Extract transitions (n-gram -> next char)
-                for i in range(len(text) - self.order):
-                    state = text[i:i + self.order]
-                    next_char = text[i + self.order]
-                    self.transitions[state][next_char] += 1
-
-                processed += 1
-                if processed % 10000 == 0:
-                    print(f"  Processed {processed:,} entries...")
+        def marked_samples() -> Generator[str, None, None]:
+            """Stream boundary-marked training texts, recording training state."""
+            nonlocal processed
+            with open(self.input_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    text = self._normalize_input(line)
+
+                    # Skip invalid entries
+                    if len(text) < self.order or len(text) > 63:
+                        continue
+
+                    # Add to training set for deduplication
+                    self.training_set.add(text)
+
+                    # Add boundary markers
+                    text = '^' * self.order + text + '$'
+
+                    # Extract start state (first n characters after boundary)
+                    start_state = text[:self.order]
+                    self.start_states[start_state] += 1
+
+                    processed += 1
+                    if processed % 10000 == 0:
+                        print(f"  Processed {processed:,} entries...")
+
+                    yield text
+
+        # Extract transitions (n-gram -> next char): count whole
+        # (order + 1)-grams with one Counter pass per batch of lines, then
+        # fold each into its state row. Batches keep memory bounded (no
+        # whole-corpus gram table) and first-seen order is preserved.
+        gram_len = self.order + 1
+        samples = marked_samples()
+        while True:
+            grams = Counter(
+                text[i:i + gram_len]
+                for text in islice(samples, self.TRAIN_BATCH_LINES)
+                for i in range(len(text) - self.order)
+            )
+            if not grams:
+                break
+            for gram, freq in grams.items():
+                self.transitions[gram[:-1]][gram[-1]] += freq
 
         # Filter by minimum frequency
         self._filter_by_frequency()
+        self._build_sampling_tables()
 
         print(f"Training complete:")
         print(f"  Processed: {processed:,} entries")
@@ -142,23 +199,65 @@ class MarkovGenerator:
         if self.min_frequency <= 1:
             return
 
-        # Filter transitions
-        filtered_transitions = defaultdict(Counter)
-        for state, counter in self.transitions.items():
-            for next_char, freq in counter.items():
-                if freq >= self.min_frequency:
-                    filtered_transitions[state][next_char] = freq
+        min_frequency = self.min_frequency
+        original_count = len(self.transitions)
+
+        # Filter transitions in place: most entries survive, so dropping the
+        # rare ones beats rebuilding (and briefly holding) a second model
+        for state in list(self.transitions):
+            counter = self.transitions[state]
+            rare = [c for c, freq in counter.items() if freq < min_frequency]
+            if len(rare) == len(counter):
+                del self.transitions[state]
+            else:
+                for next_char in rare:
+                    del counter[next_char]
 
         # Filter start states
-        self.start_states = Counter({
-            state: count for state, count in self.start_states.items()
-            if count >= self.min_frequency
-        })
+        for state in [s for s, count in self.start_states.items() if count < min_frequency]:
+            del self.start_states[state]
 
-        original_count = len(self.transitions)
-        self.transitions = filtered_transitions
         print(f"  Filtered states: {original_count:,} -> {len(self.transitions):,}")
 
+    @staticmethod
+    def _sampling_table(counter: Counter) -> SamplingTable:
+        """
+        Build a cumulative-weight table for repeated weighted sampling.
+
+        Weights are stored in a flat unsigned 64-bit array rather than as
+        boxed ints.
+
+        Args:
+            counter: Counter with elements and frequencies
+
+        Returns:
+            Tuple of (elements, cumulative weights, total weight)
+        """
+        cum_weights = array('Q', accumulate(counter.values()))
+        return tuple(counter.keys()), cum_weights, cum_weights[-1] if cum_weights else 0
+
+    def _build_sampling_tables(self):
+        """Precompute sampling tables for start states and every transition row."""
+        self._start_table = self._sampling_table(self.start_states)
+        self._transition_tables = {}
+        for state, counter in self.transitions.items():
+            if not counter:
+                continue
+            _, cum_weights, total = self._sampling_table(counter)
+            # Next symbols are single characters, so one compact str indexes
+            # exactly like a tuple of them
+            self._transition_tables[state] = (''.join(counter), cum_weights, total)
+
+    def _pick(self, table: SamplingTable) -> str:
+        """
+        Choose random element from a sampling table.
+
+        Same draw as random.choices with weights, minus rebuilding the
+        cumulative weights on every call.
+        """
+        elements, cum_weights, total = table
+        return elements[bisect_right(cum_weights, self._random() * total)]
+
     def _weighted_choice(self, counter: Counter) -> str:
         """
         Choose random element from counter based on frequency weights.
@@ -172,9 +271,7 @@ class MarkovGenerator:
         if not counter:
             return None
 
-        elements = list(counter.keys())
-        weights = list(counter.values())
-        return random.choices(elements, weights=weights, k=1)[0]
+        return self._pick(self._sampling_table(counter))
 
     def _generate_one(self) -> str:
         """
@@ -187,8 +284,10 @@ class MarkovGenerator:
             return None
 
         # Choose starting state
-        state = self._weighted_choice(self.start_states)
-        result = state.replace('^', '')  # Remove boundary markers
+        state = self._pick(self._start_table)
+        # Characters collect in a list and are joined once at the end
+        buf = list(state.replace('^', ''))  # Remove boundary markers
+        length = len(buf)
 
         max_attempts = self.max_len * 3  # Prevent infinite loops
         attempts = 0
@@ -197,36 +296,38 @@ class MarkovGenerator:
             attempts += 1
 
             # Get next character from current state
-            if state not in self.transitions:
+            table = self._transition_tables.get(state)
+            if table is None:
                 break
 
-            next_char = self._weighted_choice(self.transitions[state])
-            if not next_char:
-                break
+            next_char = self._pick(table)
 
             # End of sequence marker
             if next_char == '$':
-                if len(result) >= self.min_len:
+                if length >= self.min_len:
                     break
                 else:
                     # Too short, try to continue
                     continue
 
-            result += next_char
+            buf.append(next_char)
+            length += 1
 
             # Max length reached
-            if len(result) >= self.max_len:
+            if length >= self.max_len:
                 break
 
             # Update state (slide window)
             state = state[1:] + next_char
 
         # Final validation
-        if len(result) < self.min_len or len(result) > self.max_len:
+        if length < self.min_len or length > self.max_len:
             return None
 
-        # Basic DNS validation
-        if result.startswith('-') or result.endswith('-') or '--' in result:
+        result = ''.join(buf)
+
+        # Basic DNS validation (result is non-empty here, so index directly)
+        if result[0] == '-' or result[-1] == '-' or '--' in result:
             return None
 
         return result
@@ -238,7 +339,7 @@ class MarkovGenerator:
         Yields:
             Generated domain names (without TLD)
         """
-        generated = set()
+        generated: Set[str] = set()
         attempts = 0
         max_attempts = self.count * 100  # Allow retries for duplicates
 
@@ -263,22 +364,16 @@ class MarkovGenerator:
         Returns:
             Number of domains written
         """
-        output_path = Path(filepath)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
         print(f"Generating {self.count:,} domains...")
 
-        # Add TLD if specified
-        domains = self.generate()
-        if self.tld:
-            domains = (f"{d}.{self.tld}" for d in domains)
-
+        # TLD (if specified) is appended by the writer's join separator
         count = write_batches(
-            domains,
+            self.generate(),
             filepath,
             batch_size=10000,
             progress_total=self.count,
-            progress_every=10000
+            progress_every=10000,
+            suffix=f".{self.tld}" if self.tld else ''
         )
 
         return count
@@ -2,9 +2,11 @@ import re
 from pathlib import Path
 from typing import Generator
 
-from cleanup import process_domain
+from cleanup import plain_lt_domain, process_domain_fast
 from io_utils import write_batches
 
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9-]')
+
 
 class WordTransformGenerator:
     """
@@ -17,6 +19,8 @@ class WordTransformGenerator:
         'ą': 'a', 'č': 'c', 'ę': 'e', 'ė': 'e', 'į': 'i', 'š': 's', 'ų': 'u', 'ū': 'u', 'ž': 'z',
         'Ą': 'A', 'Č': 'C', 'Ę': 'E', 'Ė': 'E', 'Į': 'I', 'Š': 'S', 'Ų': 'U', 'Ū': 'U', 'Ž': 'Z',
     }
+    # Same mapping as a str.translate table (single C-level pass per word)
+    _LT_TRANS = str.maketrans(LITHUANIAN_TO_LATIN)
 
     def __init__(self, input_file: str, tld: str = 'lt'):
         """
@@ -31,6 +35,7 @@ class WordTransformGenerator:
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
         self.tld = tld.lstrip('.')  # Remove leading dot if present
+        self._estimated_count = None
 
     def clean_word(self, word: str) -> str:
         """
@@ -43,7 +48,7 @@ class WordTransformGenerator:
             Cleaned word string
         """
         # Remove all non-alphanumeric except hyphens
-        return re.sub(r'[^a-zA-Z0-9-]', '', word)
+        return _NON_ALNUM_RE.sub('', word)
 
     def normalize_lithuanian_chars(self, text: str) -> str:
         """
@@ -55,7 +60,7 @@ class WordTransformGenerator:
         Returns:
             Normalized text
         """
-        return ''.join(self.LITHUANIAN_TO_LATIN.get(char, char) for char in text)
+        return text.translate(self._LT_TRANS)
 
     def transform_word(self, word: str) -> str:
         """
@@ -67,27 +72,37 @@ class WordTransformGenerator:
         Returns:
             Transformed domain with TLD
         """
-        # Convert to lowercase first
-        lowercased = word.lower()
-        # Normalize Lithuanian characters
-        normalized = self.normalize_lithuanian_chars(lowercased)
-        # Clean non-alphanumeric except hyphens (after normalization)
-        cleaned = self.clean_word(normalized)
-        # Form domain
-        return f"{cleaned}.{self.tld}"
+        return f"{self._to_label(word)}.{self.tld}"
+
+    def _to_label(self, word: str) -> str:
+        """Lowercase, normalize Lithuanian characters and strip disallowed ones."""
+        return _NON_ALNUM_RE.sub('', word.lower().translate(self._LT_TRANS))
 
     def estimate_count(self) -> int:
         """
         Estimate total number of valid domains that will be generated.
 
+        Lines are counted with a C-level newline scan over binary blocks, so
+        blank lines are included. The result is cached.
+
         Returns:
             Estimated count based on input file line count
         """
-        try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                return sum(1 for line in f if line.strip())
-        except Exception:
-            return 0
+        if self._estimated_count is None:
+            try:
+                count = 0
+                last = b'\n'
+                with open(self.input_file, 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b''):
+                        count += block.count(b'\n')
+                        last = block[-1:]
+            except Exception:
+                return 0
+            # Last line without a trailing newline
+            if last != b'\n':
+                count += 1
+            self._estimated_count = count
+        return self._estimated_count
 
     def generate(self) -> Generator[str, None, None]:
         """
@@ -104,13 +119,11 @@ class WordTransformGenerator:
                     word = line.strip()
                     if not word:
                         continue
-                    domain = self.transform_word(word)
-                    cleaned, reason = process_domain(
-                        domain,
-                        target_tld=self.tld,
-                        allow_other_tlds=True,
-                        allow_subdomains=False,
-                    )
+                    label = self._to_label(word)
+                    # Plain .lt labels skip the full normalize/extract round trip
+                    cleaned = plain_lt_domain(label) if self.tld == 'lt' else None
+                    if cleaned is None:
+                        cleaned, reason = process_domain_fast(f"{label}.{self.tld}", self.tld, True, False)
                     if cleaned and cleaned not in seen:
                         seen.add(cleaned)
                         yield cleaned
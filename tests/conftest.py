@@ -0,0 +1,46 @@
+"""
+Shared pytest configuration and fixtures
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Generator modules import each other by bare name (e.g. `from io_utils import ...`)
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from markov_generator import MarkovGenerator  # noqa: E402
+from word_transform_generator import WordTransformGenerator  # noqa: E402
+
+
+# One corpus that both generators can be built on
+SHARED_CORPUS_LINES = (
+    "hello", "world", "Kaunas", "Vilnius", "ęžuolas", "šuo",
+    "test.lt", "demo.lt", "abc-def",
+)
+
+
+@pytest.fixture(scope="session")
+def shared_corpus_file(tmp_path_factory):
+    """Create a temporary corpus file shared across test modules (read-only)."""
+    path = tmp_path_factory.mktemp("shared") / "corpus.txt"
+    path.write_text("\n".join(SHARED_CORPUS_LINES) + "\n", encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def generators(shared_corpus_file):
+    """Markov and word-transform generators built once on the shared corpus."""
+    return {
+        'markov': MarkovGenerator(
+            input_file=shared_corpus_file,
+            order=2,
+            count=10,
+            tld='lt',
+            min_frequency=1,
+            seed=0
+        ),
+        'word_transform': WordTransformGenerator(input_file=shared_corpus_file, tld='lt'),
+    }
@@ -1,6 +1,9 @@
+import contextlib
+import io
 import unittest
 import tempfile
 import os
+import itertools
 from src.brute_generator import BruteForceGenerator
 
 
@@ -153,6 +156,26 @@ class TestBruteForceGenerator(unittest.TestCase):
         self.assertTrue(all('-' in domain for domain in domains))
         self.assertTrue(all(domain.endswith('.lt') for domain in domains))
 
+    def test_generate_matches_filtered_product(self):
+        """Test construction-based generation equals filtering every combination."""
+        for hyphen_mode in ('with', 'without', 'only'):
+            generator = BruteForceGenerator(
+                char_type='numbers',
+                min_len=1,
+                max_len=5,
+                hyphen_mode=hyphen_mode,
+                tld='lt'
+            )
+            expected = {
+                f"{''.join(combo)}.lt"
+                for length in range(1, 6)
+                for combo in itertools.product(generator.charset, repeat=length)
+                if generator.validate_domain(''.join(combo))
+            }
+            domains = list(generator.generate())
+            self.assertEqual(len(domains), len(expected))
+            self.assertEqual(set(domains), expected)
+
     def test_generate_to_file(self):
         """Test file output functionality."""
         generator = BruteForceGenerator(
@@ -178,6 +201,54 @@ class TestBruteForceGenerator(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_generate_to_file_parallel_matches_sequential(self):
+        """Test per-length worker output is identical to sequential output."""
+        generator = BruteForceGenerator(
+            char_type='numbers',
+            min_len=1,
+            max_len=4,
+            hyphen_mode='with',
+            tld='lt'
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sequential = os.path.join(tmpdir, 'sequential.txt')
+            parallel = os.path.join(tmpdir, 'parallel.txt')
+
+            count = generator.generate_to_file(sequential)
+            self.assertEqual(generator.generate_to_file(parallel, workers=2), count)
+
+            with open(sequential, 'rb') as f1, open(parallel, 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['parallel.txt', 'sequential.txt'])
+
+    def test_generate_to_file_parallel_progress(self):
+        """Test parallel writing honours progress_every and skips empty lengths."""
+        # Length 1 yields nothing in 'only' mode (a hyphen needs interior room)
+        generator = BruteForceGenerator(
+            char_type='numbers',
+            min_len=1,
+            max_len=3,
+            hyphen_mode='only',
+            tld='lt'
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'out.txt')
+
+            silent = io.StringIO()
+            with contextlib.redirect_stdout(silent):
+                generator.generate_to_file(output, progress_every=0, workers=2)
+            self.assertEqual(silent.getvalue(), '')
+
+            verbose = io.StringIO()
+            with contextlib.redirect_stdout(verbose):
+                count = generator.generate_to_file(output, progress_every=1, workers=2)
+            lines = verbose.getvalue().splitlines()
+            self.assertTrue(lines)
+            self.assertFalse(any(line.startswith('Progress: 0/') for line in lines))
+            self.assertTrue(lines[-1].startswith(f"Progress: {count:,}/"))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,192 @@
+import tempfile
+import unittest
+from pathlib import Path
+from urllib.parse import urlparse
+
+from src.cleanup import _EXTRACT, _split_domain, clean_file, plain_lt_domain, process_domain, remove_domains
+
+
+class TestProcessDomain(unittest.TestCase):
+    """Test cases for cleanup.process_domain."""
+
+    def test_accepts_plain_lt_domain(self):
+        """Test a plain .lt domain is normalized and accepted."""
+        self.assertEqual(process_domain("  WWW.Example.LT. "), ("example.lt", None))
+
+    def test_strips_url_scheme_and_path(self):
+        """Test URLs are reduced to their host."""
+        self.assertEqual(process_domain("https://example.lt/path?q=1"), ("example.lt", None))
+
+    def test_url_host_matches_urlparse(self):
+        """Test tabs and line breaks inside a URL are dropped as urlparse does."""
+        for url in ("HTTPS://miląco\t.LT", "http://192.gov\t/x", "http://exa\r\nmple.lt/p\tath"):
+            with self.subTest(url=url):
+                self.assertEqual(process_domain(url), process_domain(urlparse(url).netloc))
+                self.assertEqual(process_domain(url)[1], None)
+
+    def test_rejects_ip_address(self):
+        """Test IPv4 addresses are skipped."""
+        self.assertEqual(process_domain("192.168.0.1"), (None, "ip address"))
+
+    def test_rejects_invalid_characters(self):
+        """Test hosts with disallowed characters are skipped."""
+        self.assertEqual(process_domain("exa mple.lt"), (None, "invalid characters"))
+
+    def test_rejects_other_tld(self):
+        """Test non-target TLDs are skipped unless allowed."""
+        self.assertEqual(process_domain("example.com"), (None, "disallowed tld"))
+        self.assertEqual(process_domain("example.com", allow_other_tlds=True), ("example.com", None))
+
+    def test_subdomain_rules(self):
+        """Test subdomains are kept only for governmental domains."""
+        self.assertEqual(process_domain("sub.example.lt"), (None, "non-govt subdomain"))
+        self.assertEqual(process_domain("sub.example.lt", allow_subdomains=True), ("example.lt", None))
+        self.assertEqual(process_domain("vrm.lrv.lt"), ("vrm.lrv.lt", None))
+        self.assertEqual(process_domain("www.vilnius.gov.lt"), ("vilnius.gov.lt", None))
+
+    def test_rejects_short_label(self):
+        """Test labels shorter than 3 characters are skipped."""
+        self.assertEqual(process_domain("ab.lt"), (None, "domain label too short (min 3 chars)"))
+
+    def test_hyphen_rules(self):
+        """Test hyphen placement rules, allowing the punycode prefix."""
+        self.assertEqual(process_domain("-abc.lt"), (None, "hyphen at start of label"))
+        self.assertEqual(process_domain("abc-.lt"), (None, "hyphen at end of label"))
+        self.assertEqual(process_domain("ab--c.lt"), (None, "consecutive hyphens"))
+        self.assertEqual(process_domain("xn--80ak6aa92e.lt"), ("xn--80ak6aa92e.lt", None))
+
+    def test_split_domain_matches_suffix_list(self):
+        """Test the .lt fast path agrees with the public suffix list."""
+        hosts = [
+            ".lt", "a..lt", "abc.lt", "a.b.c.lt", "www.lt", "gov.lt", "a.gov.lt",
+            "b.lrv.lt", "a.b.lrv.lt", "ąžuolas.lt", "a.lt.lt", "x_y.lt", "abc.com",
+        ]
+        for host in hosts:
+            with self.subTest(host=host):
+                ext = _EXTRACT(host)
+                self.assertEqual(_split_domain(host), (ext.subdomain, ext.domain, ext.suffix))
+
+    def test_plain_lt_domain_agrees_with_process_domain(self):
+        """Test the plain-label shortcut only accepts what process_domain accepts."""
+        for label in ("abc", "a-b-c", "xn--80ak6aa92e", "www", "gov", "lrv", "ab", "a--b", "a" * 64):
+            with self.subTest(label=label):
+                domain = plain_lt_domain(label)
+                if domain is not None:
+                    self.assertEqual(process_domain(f"{label}.lt"), (domain, None))
+        self.assertEqual(plain_lt_domain("abc"), "abc.lt")
+        self.assertIsNone(plain_lt_domain("www"))
+        self.assertIsNone(plain_lt_domain("gov"))
+
+
+class TestCleanFile(unittest.TestCase):
+    """Test cases for cleanup.clean_file."""
+
+    def test_duplicates_are_counted_once_per_line(self):
+        """Test duplicate lines are validated once but still counted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "input.txt"
+            input_file.write_text(
+                "example.lt\nab.lt\n\nexample.lt\nEXAMPLE.lt\nab.lt\nother.lt\n",
+                encoding="utf-8",
+            )
+            output_file = Path(tmpdir) / "output.txt"
+
+            result = clean_file(input_file, output_file)
+
+            self.assertEqual(result.processed_count, 6)
+            self.assertEqual(result.skipped_count, 2)
+            self.assertEqual(result.cleaned_count, 2)
+            self.assertEqual(output_file.read_text(encoding="utf-8"), "example.lt\nother.lt\n")
+            self.assertEqual(
+                result.errors_path.read_text(encoding="utf-8"),
+                "Line 2: domain label too short (min 3 chars) | ab.lt\n",
+            )
+
+    def test_workers_match_single_process(self):
+        """Test pooled validation produces the same files as a single process."""
+        lines = [f"name{i}.lt" for i in range(20)] + ["ab.lt", "bad..lt", "name3.lt", "x.com"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "input.txt"
+            input_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+            single = clean_file(input_file, Path(tmpdir) / "single.txt")
+            pooled = clean_file(input_file, Path(tmpdir) / "pooled.txt", workers=2, chunk_size=5)
+
+            self.assertEqual(
+                (pooled.cleaned_count, pooled.skipped_count, pooled.processed_count),
+                (single.cleaned_count, single.skipped_count, single.processed_count),
+            )
+            self.assertEqual(
+                (Path(tmpdir) / "pooled.txt").read_text(encoding="utf-8"),
+                (Path(tmpdir) / "single.txt").read_text(encoding="utf-8"),
+            )
+            self.assertEqual(
+                pooled.errors_path.read_text(encoding="utf-8"),
+                single.errors_path.read_text(encoding="utf-8"),
+            )
+
+
+class TestRemoveDomains(unittest.TestCase):
+    """Test cases for cleanup.remove_domains."""
+
+    def test_removes_case_insensitively(self):
+        """Test removees are matched case-insensitively and order is kept."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parent = Path(tmpdir) / "parent.txt"
+            removees = Path(tmpdir) / "removees.txt"
+            parent.write_text("alpha.lt\nBeta.lt\n\ngamma.lt\ndelta.lt\n", encoding="utf-8")
+            removees.write_text("beta.lt\nDELTA.LT\n", encoding="utf-8")
+
+            result = remove_domains(parent, removees)
+
+            self.assertEqual((result.kept_count, result.removed_count), (2, 2))
+            self.assertEqual(result.output_path, Path(tmpdir) / "parent_minus_removees.txt")
+            self.assertEqual(result.output_path.read_text(encoding="utf-8"), "alpha.lt\ngamma.lt\n")
+
+    def test_matches_text_mode_semantics(self):
+        """Test line breaks, whitespace and non-ASCII case folding match str handling."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parent = Path(tmpdir) / "parent.txt"
+            removees = Path(tmpdir) / "removees.txt"
+            parent.write_bytes(
+                "alpha.lt\r\n  ĄŽUOLAS.lt \rbeta.lt\x1c\n\r\nšilas.lt\ngamma.lt".encode("utf-8")
+            )
+            removees.write_text("ąžuolas.lt\nBETA.lt\n", encoding="utf-8")
+
+            result = remove_domains(parent, removees)
+
+            self.assertEqual((result.kept_count, result.removed_count), (3, 2))
+            self.assertEqual(
+                result.output_path.read_text(encoding="utf-8"),
+                "alpha.lt\nšilas.lt\ngamma.lt\n",
+            )
+
+    def test_failed_run_leaves_no_partial_file(self):
+        """Test an undecodable parent raises without leaving a temp file behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parent = Path(tmpdir) / "parent.txt"
+            removees = Path(tmpdir) / "removees.txt"
+            parent.write_bytes(b"alpha.lt\n\xff\xfe.lt\n")
+            removees.write_text("beta.lt\n", encoding="utf-8")
+
+            with self.assertRaises(UnicodeDecodeError):
+                remove_domains(parent, removees)
+
+            self.assertEqual(sorted(p.name for p in Path(tmpdir).iterdir()), ["parent.txt", "removees.txt"])
+
+    def test_output_may_overwrite_parent(self):
+        """Test writing the result over the parent file itself."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parent = Path(tmpdir) / "parent.txt"
+            removees = Path(tmpdir) / "removees.txt"
+            parent.write_text("alpha.lt\nbeta.lt\n", encoding="utf-8")
+            removees.write_text("beta.lt\n", encoding="utf-8")
+
+            remove_domains(parent, removees, parent)
+
+            self.assertEqual(parent.read_text(encoding="utf-8"), "alpha.lt\n")
+            self.assertEqual(sorted(p.name for p in Path(tmpdir).iterdir()), ["parent.txt", "removees.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.io_utils import write_batches
+
+
+class TestWriteBatches(unittest.TestCase):
+    """Test cases for io_utils.write_batches."""
+
+    def test_recreates_removed_directory(self):
+        """Test a directory deleted between writes is created again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "out" / "x.txt"
+
+            write_batches(["a"], str(output_file))
+            shutil.rmtree(output_file.parent)
+            write_batches(["b"], str(output_file))
+
+            self.assertEqual(output_file.read_text(encoding="utf-8"), "b\n")
+
+    def test_relative_path_follows_working_directory(self):
+        """Test a relative output directory is resolved against the current directory."""
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            os.chdir(first)
+            write_batches(["a"], "out/x.txt")
+            os.chdir(second)
+            write_batches(["b"], "out/x.txt")
+
+            self.assertEqual((Path(first) / "out" / "x.txt").read_text(encoding="utf-8"), "a\n")
+            self.assertEqual((Path(second) / "out" / "x.txt").read_text(encoding="utf-8"), "b\n")
+
+    def test_suffix_is_appended_to_every_item(self):
+        """Test the suffix lands on each line, including the last one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = Path(tmpdir) / "x.txt"
+
+            count = write_batches(["a", "b", "c"], str(output_file), batch_size=2, suffix=".lt")
+
+            self.assertEqual(count, 3)
+            self.assertEqual(output_file.read_text(encoding="utf-8"), "a.lt\nb.lt\nc.lt\n")
+
+    def test_bom_codec_writes_a_single_bom(self):
+        """Test codecs with a byte order mark emit it once across batches."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for encoding in ("utf-16", "utf-8-sig"):
+                with self.subTest(encoding=encoding):
+                    output_file = Path(tmpdir) / f"{encoding}.txt"
+
+                    write_batches(["a", "b", "c"], str(output_file), batch_size=1, encoding=encoding)
+
+                    self.assertEqual(output_file.read_text(encoding=encoding), "a\nb\nc\n")
+                    self.assertEqual(output_file.read_bytes(), "a\nb\nc\n".encode(encoding))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,54 +2,63 @@
 Tests for MarkovGenerator
 """
 import pytest
-from pathlib import Path
-import tempfile
-import os
+import random
 
 from markov_generator import MarkovGenerator
 
 
-@pytest.fixture
-def sample_corpus_file():
-    """Create a temporary corpus file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        # Write some sample domains
-        f.write("test.lt\n")
-        f.write("demo.lt\n")
-        f.write("sample.lt\n")
-        f.write("example.lt\n")
-        f.write("domain.lt\n")
-        f.write("testing.lt\n")
-        f.write("demonstration.lt\n")
-        f.write("alpha\n")
-        f.write("beta\n")
-        f.write("gamma\n")
-        f.write("delta\n")
-        f.write("epsilon\n")
-        f.write("data\n")
-        f.write("code\n")
-        f.write("test123\n")
-        f.write("abc-def\n")
-        filename = f.name
-
-    yield filename
-
-    # Cleanup
-    os.unlink(filename)
-
-
-def test_markov_generator_initialization(sample_corpus_file):
-    """Test MarkovGenerator initialization."""
-    generator = MarkovGenerator(
+# Sample domains/words used as the training corpus
+CORPUS_LINES = (
+    "test.lt", "demo.lt", "sample.lt", "example.lt", "domain.lt", "testing.lt",
+    "demonstration.lt", "alpha", "beta", "gamma", "delta", "epsilon", "data",
+    "code", "test123", "abc-def",
+)
+# Encoded once at import; the fixture writes it in binary mode
+_CORPUS_BYTES = ("\n".join(CORPUS_LINES) + "\n").encode('utf-8')
+
+
+@pytest.fixture(scope="session")
+def sample_corpus_file(tmp_path_factory):
+    """Create a temporary corpus file shared by the whole test session (read-only)."""
+    path = tmp_path_factory.mktemp("corpus") / "sample.txt"
+    path.write_bytes(_CORPUS_BYTES)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def markov_gen(sample_corpus_file):
+    """Trained generator shared by tests that only read the model."""
+    return MarkovGenerator(
         input_file=sample_corpus_file,
         order=2,
         min_len=3,
         max_len=6,
         count=10,
         tld='lt',
-        min_frequency=1
+        min_frequency=1,
+        seed=0
     )
 
+
+@pytest.fixture(scope="session", params=[1, 3, 4])
+def markov_gen_by_order(request, sample_corpus_file):
+    """Trained generator for each n-gram order, built once per order (order 2 is markov_gen)."""
+    return MarkovGenerator(
+        input_file=sample_corpus_file,
+        order=request.param,
+        min_len=3,
+        max_len=6,
+        count=3,
+        tld='',
+        min_frequency=1,
+        seed=0
+    )
+
+
+def test_markov_generator_initialization(markov_gen):
+    """Test MarkovGenerator initialization."""
+    generator = markov_gen
+
     assert generator.order == 2
     assert generator.min_len == 3
     assert generator.max_len == 6
@@ -59,26 +68,22 @@ def test_markov_generator_initialization(sample_corpus_file):
     assert len(generator.transitions) > 0
 
 
-def test_markov_generator_invalid_params():
+def test_markov_generator_invalid_params(tmp_path):
     """Test MarkovGenerator with invalid parameters."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        f.write("test\n")
-        temp_file = f.name
+    temp_file = tmp_path / 'corpus.txt'
+    temp_file.write_text("test\n", encoding='utf-8')
 
-    try:
-        # Invalid order
-        with pytest.raises(ValueError, match="Order must be at least 1"):
-            MarkovGenerator(temp_file, order=0, count=10)
+    # Invalid order
+    with pytest.raises(ValueError, match="Order must be at least 1"):
+        MarkovGenerator(temp_file, order=0, count=10)
 
-        # Invalid length range
-        with pytest.raises(ValueError, match="Invalid length range"):
-            MarkovGenerator(temp_file, order=2, min_len=10, max_len=5, count=10)
+    # Invalid length range
+    with pytest.raises(ValueError, match="Invalid length range"):
+        MarkovGenerator(temp_file, order=2, min_len=10, max_len=5, count=10)
 
-        # Invalid count
-        with pytest.raises(ValueError, match="Count must be at least 1"):
-            MarkovGenerator(temp_file, order=2, count=0)
-    finally:
-        os.unlink(temp_file)
+    # Invalid count
+    with pytest.raises(ValueError, match="Count must be at least 1"):
+        MarkovGenerator(temp_file, order=2, count=0)
 
 
 def test_markov_generator_missing_file():
@@ -91,24 +96,34 @@ def test_markov_generator_missing_file():
         )
 
 
-def test_normalize_input(sample_corpus_file):
-    """Test input normalization."""
-    generator = MarkovGenerator(sample_corpus_file, order=2, count=10)
+def test_normalize_input(markov_gen):
+    """Test Markov-specific input normalization (shared cases: test_normalization.py)."""
+    generator = markov_gen
 
     # Test TLD removal
     assert generator._normalize_input("test.lt") == "test"
     assert generator._normalize_input("TEST.COM") == "test"
 
-    # Test lowercase
-    assert generator._normalize_input("UPPERCASE") == "uppercase"
-
     # Test hyphen handling
-    assert generator._normalize_input("test-domain") == "test-domain"
     assert generator._normalize_input("-leading") == "leading"
     assert generator._normalize_input("trailing-") == "trailing"
 
-    # Test invalid characters removal
-    assert generator._normalize_input("test@#$domain") == "testdomain"
+    # Test only the final TLD is removed and non-ASCII letters are kept
+    assert generator._normalize_input("lt.co.lt") == "ltco"
+    assert generator._normalize_input("example.company") == "examplecompany"
+    assert generator._normalize_input("Ąžuolas_Ž.lt") == "ąžuolasž"
+
+
+def test_batched_training_matches_single_pass(sample_corpus_file, monkeypatch):
+    """Test counting n-grams in small line batches builds the identical model."""
+    whole = MarkovGenerator(sample_corpus_file, order=2, count=10, min_frequency=1)
+    monkeypatch.setattr(MarkovGenerator, 'TRAIN_BATCH_LINES', 3)
+    batched = MarkovGenerator(sample_corpus_file, order=2, count=10, min_frequency=1)
+
+    assert batched.transitions == whole.transitions
+    assert [list(row) for row in batched.transitions.values()] == \
+        [list(row) for row in whole.transitions.values()]
+    assert list(batched.transitions) == list(whole.transitions)
 
 
 def test_generate_basic(sample_corpus_file):
@@ -118,16 +133,17 @@ def test_generate_basic(sample_corpus_file):
         order=2,
         min_len=3,
         max_len=6,
-        count=5,
+        count=3,
         tld='',  # No TLD for easier testing
-        min_frequency=1
+        min_frequency=1,
+        seed=0
     )
 
     domains = list(generator.generate())
 
     # Should generate requested count (or close to it)
     assert len(domains) > 0
-    assert len(domains) <= 5
+    assert len(domains) <= 3
 
     # All should be within length range
     for domain in domains:
@@ -141,37 +157,63 @@ def test_generate_basic(sample_corpus_file):
         assert domain not in generator.training_set
 
 
-def test_generate_to_file(sample_corpus_file):
-    """Test generating domains to file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_file = Path(tmpdir) / 'output.txt'
-
+def test_seed_reproducible(sample_corpus_file):
+    """Test the same seed yields the same domains regardless of global state."""
+    def run(seed):
         generator = MarkovGenerator(
-            input_file=sample_corpus_file,
-            order=2,
-            min_len=3,
-            max_len=6,
-            count=10,
-            tld='lt',
-            min_frequency=1
+            sample_corpus_file, order=2, min_len=3, max_len=6, count=5, min_frequency=1, seed=seed
         )
+        return list(generator.generate())
 
-        count = generator.generate_to_file(str(output_file))
+    random.seed(1)
+    first = run(42)
+    random.seed(2)
+    assert run(42) == first
+    assert random.random() == random.Random(2).random()
 
-        # Should write some domains
-        assert count > 0
-        assert count <= 10
 
-        # File should exist and have content
-        assert output_file.exists()
-        with open(output_file, 'r') as f:
-            lines = f.readlines()
+def test_generate_to_file(sample_corpus_file, tmp_path):
+    """Test generating domains to file."""
+    output_file = tmp_path / 'output.txt'
 
-        assert len(lines) == count
+    generator = MarkovGenerator(
+        input_file=sample_corpus_file,
+        order=2,
+        min_len=3,
+        max_len=6,
+        count=10,
+        tld='lt',
+        min_frequency=1
+    )
+
+    count = generator.generate_to_file(str(output_file))
+
+    # Should write some domains
+    assert count > 0
+    assert count <= 10
+
+    # File should exist and have content
+    assert output_file.exists()
+    lines = output_file.read_text(encoding='utf-8').splitlines()
+
+    assert len(lines) == count
+
+    # All lines should end with .lt
+    for line in lines:
+        assert line.endswith('.lt')
+
+
+def test_generate_to_file_matches_generate(sample_corpus_file, tmp_path):
+    """Test the file holds exactly the generated domains with the TLD appended."""
+    def make():
+        return MarkovGenerator(
+            sample_corpus_file, order=2, min_len=3, max_len=6, count=10, tld='lt', min_frequency=1, seed=7
+        )
 
-        # All lines should end with .lt
-        for line in lines:
-            assert line.strip().endswith('.lt')
+    output_file = tmp_path / 'output.txt'
+    make().generate_to_file(str(output_file))
+    expected = ''.join(f"{d}.lt\n" for d in make().generate())
+    assert output_file.read_text(encoding='utf-8') == expected
 
 
 def test_estimate_count(sample_corpus_file):
@@ -189,46 +231,30 @@ def test_estimate_count(sample_corpus_file):
     assert estimate == 100  # Markov returns target count
 
 
-def test_weighted_choice():
+def test_weighted_choice(markov_gen):
     """Test weighted random choice."""
     from collections import Counter
 
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-        f.write("test\n")
-        temp_file = f.name
+    generator = markov_gen
+    generator._rng.seed(0)  # Shared fixture: pin the draws regardless of test order
 
-    try:
-        generator = MarkovGenerator(temp_file, order=2, count=10)
+    # Test with valid counter
+    counter = Counter({'a': 10, 'b': 5, 'c': 1})
+    choices = [generator._weighted_choice(counter) for _ in range(30)]
 
-        # Test with valid counter
-        counter = Counter({'a': 10, 'b': 5, 'c': 1})
-        choices = [generator._weighted_choice(counter) for _ in range(100)]
+    # All choices should be valid
+    assert all(c in ['a', 'b', 'c'] for c in choices)
 
-        # All choices should be valid
-        assert all(c in ['a', 'b', 'c'] for c in choices)
+    # 'a' should appear most frequently (though probabilistic)
+    assert choices.count('a') > choices.count('c')
 
-        # 'a' should appear most frequently (though probabilistic)
-        assert choices.count('a') > choices.count('c')
+    # Test with empty counter
+    assert generator._weighted_choice(Counter()) is None
 
-        # Test with empty counter
-        assert generator._weighted_choice(Counter()) is None
-    finally:
-        os.unlink(temp_file)
 
-
-def test_dns_validation(sample_corpus_file):
+def test_dns_validation(markov_gen):
     """Test that generated domains follow DNS rules."""
-    generator = MarkovGenerator(
-        input_file=sample_corpus_file,
-        order=2,
-        min_len=3,
-        max_len=8,
-        count=20,
-        tld='',
-        min_frequency=1
-    )
-
-    domains = list(generator.generate())
+    domains = list(markov_gen.generate())
 
     for domain in domains:
         # Should not start or end with hyphen
@@ -242,22 +268,13 @@ def test_dns_validation(sample_corpus_file):
         assert all(c.isalnum() or c == '-' for c in domain)
 
 
-def test_different_orders(sample_corpus_file):
+def test_different_orders(markov_gen_by_order):
     """Test generation with different n-gram orders."""
-    for order in [1, 2, 3, 4]:
-        generator = MarkovGenerator(
-            input_file=sample_corpus_file,
-            order=order,
-            min_len=3,
-            max_len=6,
-            count=5,
-            tld='',
-            min_frequency=1
-        )
+    generator = markov_gen_by_order
 
-        domains = list(generator.generate())
-        assert len(domains) > 0
+    domains = list(generator.generate())
+    assert len(domains) > 0
 
-        # Higher orders should have more states
-        if order > 1:
-            assert len(generator.transitions) > 0
+    # Higher orders should have more states
+    if generator.order > 1:
+        assert len(generator.transitions) > 0
@@ -0,0 +1,31 @@
+"""
+Tests for input normalization shared by the Markov and word-transform generators
+"""
+import pytest
+
+
+# Markov strips a raw line to a bare label; word transform turns a word into a domain
+NORMALIZERS = {
+    'markov': lambda generator, text: generator._normalize_input(text),
+    'word_transform': lambda generator, text: generator.transform_word(text),
+}
+
+
+@pytest.mark.parametrize("gen_name,text,expected", [
+    # Lowercase
+    ('markov', "UPPERCASE", "uppercase"),
+    ('word_transform', "KAUNAS", "kaunas.lt"),
+    # Hyphens are kept
+    ('markov', "test-domain", "test-domain"),
+    ('word_transform', "test-domain", "test-domain.lt"),
+    # Invalid characters are removed
+    ('markov', "test@#$domain", "testdomain"),
+    ('word_transform', "test@#$domain", "testdomain.lt"),
+    ('word_transform', "Hello.World", "helloworld.lt"),
+    # Lithuanian letters: Markov keeps them, word transform maps them to Latin
+    ('markov', "Ęžuolas", "ęžuolas"),
+    ('word_transform', "Ęžuolas", "ezuolas.lt"),
+])
+def test_normalization(generators, gen_name, text, expected):
+    """Test both generators normalize raw input the same documented way."""
+    assert NORMALIZERS[gen_name](generators[gen_name], text) == expected